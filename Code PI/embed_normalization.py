@@ -0,0 +1,77 @@
+"""Bouw de ImageNet-normalisatie in het ONNX-model in.
+
+Voegt Cast(uint8 -> float) -> Mul(scale) -> Add(bias) toe vóór de eerste laag
+en maakt de modelinvoer uint8 [N, 3, 224, 224]. De normalisatie draait dan in
+de graaf (nog steeds over de volledige tensor, elke inferentie) en de GUI doet
+geen float-rekenwerk meer: enkel schalen en naar NCHW omzetten. ONNX Runtime
+vouwt die stap niet in de eerste convolutie; het werk verhuist van NumPy naar
+ONNX Runtime, het verdwijnt niet:
+  python embed_normalization.py model.onnx model.u8.onnx
+  python rpi_display_gui.py --model model.u8.onnx
+"""
+
+import argparse
+import os
+
+import numpy as np
+import onnx
+from onnx import TensorProto, helper, numpy_helper
+
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+
+def embed_normalization(model_input: str, model_output: str) -> None:
+    if not os.path.exists(model_input):
+        print(f"File not found: {model_input}")
+        return
+
+    model = onnx.load(model_input)
+    graph = model.graph
+    graph_input = graph.input[0]
+    input_name = graph_input.name
+
+    if graph_input.type.tensor_type.elem_type == TensorProto.UINT8:
+        print(f"{model_input} heeft al een uint8-invoer, niets te doen.")
+        return
+
+    print(f"--- Embedding normalization {model_input} -> {model_output} ---")
+    normalized_name = f"{input_name}_normalized"
+    for node in graph.node:
+        for index, name in enumerate(node.input):
+            if name == input_name:
+                node.input[index] = normalized_name
+
+    # (x / 255 - mean) / std == x * scale + bias, per kanaal
+    scale = (1.0 / (255.0 * IMAGENET_STD)).reshape(1, 3, 1, 1).astype(np.float32)
+    bias = (-IMAGENET_MEAN / IMAGENET_STD).reshape(1, 3, 1, 1).astype(np.float32)
+    graph.initializer.extend([
+        numpy_helper.from_array(scale, name=f"{input_name}_scale"),
+        numpy_helper.from_array(bias, name=f"{input_name}_bias"),
+    ])
+
+    prologue = [
+        helper.make_node("Cast", [input_name], [f"{input_name}_float"], to=TensorProto.FLOAT),
+        helper.make_node("Mul", [f"{input_name}_float", f"{input_name}_scale"], [f"{input_name}_scaled"]),
+        helper.make_node("Add", [f"{input_name}_scaled", f"{input_name}_bias"], [normalized_name]),
+    ]
+    for position, node in enumerate(prologue):
+        graph.node.insert(position, node)
+
+    graph_input.type.tensor_type.elem_type = TensorProto.UINT8
+
+    onnx.checker.check_model(model)
+    onnx.save(model, model_output)
+    print(f"Done. Input '{input_name}' is now uint8 (RGB, NCHW, 0-255)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bouw de normalisatie in het ONNX-model in")
+    parser.add_argument("model_input", nargs="?", default="model.onnx", help="FP32 ONNX-model")
+    parser.add_argument("model_output", nargs="?", default="model.u8.onnx", help="Uitvoerpad model met uint8-invoer")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    embed_normalization(args.model_input, args.model_output)
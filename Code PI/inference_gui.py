@@ -357,9 +357,9 @@ class InferenceGUI:
         preview_h = self.preview_label.winfo_height()
         
         if preview_w > 1 and preview_h > 1:
-             img = img.resize((preview_w, preview_h), Image.Resampling.LANCZOS)
+             img = img.resize((preview_w, preview_h), Image.Resampling.BILINEAR)
         else:
-             img = img.resize((self.config.preview_width, self.config.preview_height), Image.Resampling.LANCZOS)
+             img = img.resize((self.config.preview_width, self.config.preview_height), Image.Resampling.BILINEAR)
 
         photo = ImageTk.PhotoImage(img)
         self.preview_label.configure(image=photo, text="")
@@ -390,7 +390,7 @@ class InferenceGUI:
             except Exception:
                 pass # Fallback to default 224x224
         
-        img = Image.fromarray(image).resize((target_w, target_h))
+        img = Image.fromarray(image).resize((target_w, target_h), Image.Resampling.BILINEAR)
         img_array = np.array(img).astype(np.float32) / 255.0
 
         mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
@@ -0,0 +1,116 @@
+"""Kwantiseer het FP32 ONNX-model naar INT8 voor snellere inferentie op de Pi.
+
+Eenmalige build-stap. rpi_display_gui.py kiest model.int8.onnx automatisch
+wanneer het naast model.onnx staat.
+
+Statisch (aanbevolen voor CNN's), met 50-100 voorbeeldfoto's als kalibratie:
+  python quantize_model.py model.onnx model.int8.onnx --calibration-dir fotos/
+
+Dynamisch (zonder kalibratiebeelden):
+  python quantize_model.py model.onnx model.int8.onnx
+
+Controleer na het kwantiseren de nauwkeurigheid op een aparte testset.
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+import onnxruntime as ort
+from onnxruntime.quantization import (
+    CalibrationDataReader,
+    QuantFormat,
+    QuantType,
+    quantize_dynamic,
+    quantize_static,
+)
+from PIL import Image
+
+# Zelfde voorbewerking als SmartBinDisplayApp.preprocess_image
+INPUT_SIZE = (224, 224)
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp"}
+
+
+class ImageFolderReader(CalibrationDataReader):
+    """Levert voorbewerkte kalibratiebeelden (NCHW) uit een map.
+
+    Modellen met een uint8-invoer (zie embed_normalization.py) krijgen ruwe
+    pixels; de normalisatie zit dan al in de graaf.
+    """
+
+    def __init__(self, image_dir: str, input_name: str, raw_uint8: bool = False, limit: int = 100):
+        paths = sorted(
+            path for path in Path(image_dir).rglob("*") if path.suffix.lower() in IMAGE_SUFFIXES
+        )
+        print(f"Calibration images: {min(len(paths), limit)} from {image_dir}")
+        self._input_name = input_name
+        self._raw_uint8 = raw_uint8
+        self._paths = iter(paths[:limit])
+
+    def get_next(self) -> dict[str, np.ndarray] | None:
+        path = next(self._paths, None)
+        if path is None:
+            return None
+
+        img = Image.open(path).convert("RGB").resize(INPUT_SIZE, Image.Resampling.BILINEAR)
+        if self._raw_uint8:
+            img_array = np.asarray(img, dtype=np.uint8).transpose(2, 0, 1)[np.newaxis]
+            return {self._input_name: np.ascontiguousarray(img_array)}
+
+        img_array = np.asarray(img, dtype=np.float32) / 255.0
+        img_array = (img_array - IMAGENET_MEAN) / IMAGENET_STD
+        img_array = np.ascontiguousarray(img_array.transpose(2, 0, 1)[np.newaxis], dtype=np.float32)
+        return {self._input_name: img_array}
+
+
+def quantize_model(model_input: str, model_output: str, calibration_dir: str | None = None) -> None:
+    if not os.path.exists(model_input):
+        print(f"File not found: {model_input}")
+        return
+
+    if calibration_dir:
+        print(f"--- Static quantization {model_input} -> {model_output} ---")
+        input_meta = ort.InferenceSession(model_input).get_inputs()[0]
+        raw_uint8 = input_meta.type == "tensor(uint8)"
+        # QDQ-knopen kwantiseren binnen de graaf; de invoer van de GUI blijft ongewijzigd
+        quantize_static(
+            model_input,
+            model_output,
+            calibration_data_reader=ImageFolderReader(calibration_dir, input_meta.name, raw_uint8),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+        )
+    else:
+        print(f"--- Dynamic quantization {model_input} -> {model_output} ---")
+        quantize_dynamic(
+            model_input,
+            model_output,
+            per_channel=True,
+            weight_type=QuantType.QUInt8,
+        )
+
+    size_in = os.path.getsize(model_input) / (1024 * 1024)
+    size_out = os.path.getsize(model_output) / (1024 * 1024)
+    print(f"Done: {size_in:.1f} MB -> {size_out:.1f} MB")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Kwantiseer een ONNX-model naar INT8")
+    parser.add_argument("model_input", nargs="?", default="model.onnx", help="FP32 ONNX-model")
+    parser.add_argument("model_output", nargs="?", default="model.int8.onnx", help="Uitvoerpad INT8-model")
+    parser.add_argument(
+        "--calibration-dir",
+        default=None,
+        help="Map met voorbeeldfoto's voor statische kwantisatie (anders dynamisch)",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    quantize_model(args.model_input, args.model_output, args.calibration_dir)
@@ -1,9 +1,11 @@
 import argparse
+import json
+import os
 import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 
 import numpy as np
 import onnxruntime as ort
@@ -32,6 +34,16 @@ except ImportError as exc:
         "  python -m pip install --upgrade pillow"
     ) from exc
 
+try:
+    import cv2  # NEON-geoptimaliseerde resize; optioneel, anders valt PIL in
+except ImportError:
+    cv2 = None
+
+try:
+    import numba  # JIT-kernel voor de normalisatie; optioneel, anders NumPy
+except ImportError:
+    numba = None
+
 
 DEFAULT_CLASSES = ("Organisch", "PMD", "Papier", "Restafval")
 DEFAULT_COLORS = ("#4CAF50", "#FFC107", "#2196F3", "#757575")
@@ -44,6 +56,46 @@ COLOR_ACCENT = "#3498DB"
 COLOR_SUCCESS = "#2ECC71"
 COLOR_ERROR = "#E74C3C"
 
+# Core-indeling bij --affinity (Pi met 4 cores): Tk, camera/opslag, inferentie
+CORES_UI = {0}
+CORES_IO = {1}
+CORES_INFERENCE = {2, 3}
+
+# Gekwantiseerd model (zie quantize_model.py) krijgt voorrang op het FP32-model
+MODEL_FILENAMES = ("model.int8.onnx", "model.onnx")
+
+# Maximale wachttijd bij afsluiten om openstaande foto's nog weg te schrijven
+SAVE_FLUSH_TIMEOUT_S = 5.0
+
+# Maximaal aantal frames wachten op AE/AWB na camera.start() (~1 s bij 30 fps)
+AE_SETTLE_MAX_FRAMES = 30
+
+# Normalisatie (ImageNet), voorgeschaald zodat ruwe uint8-pixels direct bruikbaar zijn:
+# (x / 255 - mean) / std == x * scale + bias
+INPUT_SIZE = (224, 224)
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+NORM_SCALE = (1.0 / (255.0 * IMAGENET_STD)).astype(np.float32)
+NORM_BIAS = (-IMAGENET_MEAN / IMAGENET_STD).astype(np.float32)
+
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _normalize_bgr_to_nchw(src, scale, bias, dst):
+        """Normaliseer een BGR uint8-frame naar RGB-floats in NCHW-volgorde.
+
+        De binnenste lus loopt over x, zodat elke uitvoerrij sequentieel wordt
+        geschreven; de drie leesgangen over een rij blijven in de cache.
+        """
+        height, width, _ = src.shape
+        for y in numba.prange(height):
+            for c in range(3):
+                src_c = 2 - c
+                for x in range(width):
+                    dst[0, c, y, x] = src[y, x, src_c] * scale[c] + bias[c]
+else:
+    _normalize_bgr_to_nchw = None
+
 
 @dataclass(frozen=True)
 class DisplayConfig:
@@ -55,6 +107,8 @@ class DisplayConfig:
     fullscreen: bool = False
     rotate: int = 0
     update_ms: int = 50
+    burst_size: int = 4
+    pin_cores: bool = False
 
 
 def resolve_model_path(model_path: str | None = None) -> str:
@@ -70,17 +124,17 @@ def resolve_model_path(model_path: str | None = None) -> str:
             candidates.append((Path.cwd() / user_path).resolve())
             candidates.append((script_dir / user_path).resolve())
 
-    candidates.append((script_dir / "model.onnx").resolve())
+    candidates.extend((script_dir / name).resolve() for name in MODEL_FILENAMES)
 
     # Zoek in de AI map (Code PI/AI)
     ai_subdir = script_dir / "AI"
     if ai_subdir.exists():
-        candidates.append((ai_subdir / "model.onnx").resolve())
+        candidates.extend((ai_subdir / name).resolve() for name in MODEL_FILENAMES)
 
     # Zoek ook in de Ai-model map (Fallback)
     ai_dir = script_dir.parent / "Ai-model"
     if ai_dir.exists():
-        candidates.append((ai_dir / "model.onnx").resolve())
+        candidates.extend((ai_dir / name).resolve() for name in MODEL_FILENAMES)
 
     checked: list[Path] = []
     seen: set[str] = set()
@@ -103,9 +157,101 @@ def resolve_model_path(model_path: str | None = None) -> str:
     )
 
 
+def pin_current_thread(cores: set[int]) -> None:
+    """Pin de aanroepende thread op de gegeven cores; nieuwe threads erven dit over."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    # Niet tegen sched_getaffinity(0) filteren: dat is de (mogelijk al gepinde) huidige thread
+    usable = {core for core in cores if core < (os.cpu_count() or 1)}
+    if usable:
+        os.sched_setaffinity(0, usable)
+
+
+def _session_options(intra_op_threads: int | None = None) -> ort.SessionOptions:
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = intra_op_threads or os.cpu_count() or 4
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    # ORT-standaardwaarden, expliciet gezet: vaste invoervorm, dus het
+    # geheugenplan en de arena worden over inferenties hergebruikt
+    options.enable_mem_pattern = True
+    options.enable_cpu_mem_arena = True
+    return options
+
+
+def _optimized_cache_key(source: Path) -> dict[str, object]:
+    # mtime alleen volstaat niet (cp -p, rsync -a); een geoptimaliseerde graaf
+    # is bovendien enkel geldig voor de ORT-versie die hem schreef
+    stat = source.stat()
+    key: dict[str, object] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "onnxruntime": ort.__version__,
+    }
+    # Gewichten in een apart bestand (model.onnx.data) komen inline in de
+    # .opt.onnx terecht; een nieuw databestand moet de cache dus ook ongeldig maken
+    external_data = source.with_name(f"{source.name}.data")
+    if external_data.exists():
+        data_stat = external_data.stat()
+        key["external_data"] = [data_stat.st_size, data_stat.st_mtime_ns]
+    return key
+
+
+def create_inference_session(
+    model_path: str, intra_op_threads: int | None = None
+) -> ort.InferenceSession:
+    """Maak een ONNX Runtime-sessie afgestemd op de CPU van de Pi."""
+    # XNNPACK heeft NEON-kernels voor MobileNet-achtige netwerken, indien meegebouwd
+    providers: list = ["CPUExecutionProvider"]
+    if "XnnpackExecutionProvider" in ort.get_available_providers():
+        # XNNPACK heeft een eigen thread-pool voor Conv/Gemm: die krijgt de cores.
+        # De ORT-pool (enkel nog voor de overige, lichte ops) gaat naar 1 thread en
+        # spint niet, anders vechten twee pools om dezelfde cores
+        options = _session_options(intra_op_threads)
+        xnnpack_options = {"intra_op_num_threads": str(options.intra_op_num_threads)}
+        options.intra_op_num_threads = 1
+        options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        providers.insert(0, ("XnnpackExecutionProvider", xnnpack_options))
+        return ort.InferenceSession(model_path, sess_options=options, providers=providers)
+
+    # Geoptimaliseerde graaf eenmalig wegschrijven en bij volgende starts herladen.
+    # Enkel voor de CPU-provider: die graaf is specifiek voor deze hardware.
+    # Het JSON-bestand ernaast wordt pas geschreven als de sessie gelukt is.
+    source = Path(model_path)
+    optimized = source.with_name(f"{source.stem}.opt.onnx")
+    cache_meta = optimized.with_suffix(".json")
+    cache_key = _optimized_cache_key(source)
+
+    try:
+        if json.loads(cache_meta.read_text()) == cache_key:
+            options = _session_options(intra_op_threads)
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            return ort.InferenceSession(str(optimized), sess_options=options, providers=providers)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # noqa: BLE001
+        print(f"Optimized model cache unusable ({exc}), loading {source.name}")
+
+    if os.access(source.parent, os.W_OK):
+        options = _session_options(intra_op_threads)
+        options.optimized_model_filepath = str(optimized)
+        try:
+            cache_meta.unlink(missing_ok=True)
+            session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+            cache_meta.write_text(json.dumps(cache_key))
+            return session
+        except Exception as exc:  # noqa: BLE001
+            print(f"Could not write optimized model cache: {exc}")
+
+    return ort.InferenceSession(
+        model_path, sess_options=_session_options(intra_op_threads), providers=providers
+    )
+
+
 class SmartBinDisplayApp:
     def __init__(self, config: DisplayConfig):
         self.config = config
+        self._pin_thread(CORES_UI)
         self.classes = list(DEFAULT_CLASSES)
         self.colors = list(DEFAULT_COLORS)
         self.running = True
@@ -113,9 +259,25 @@ class SmartBinDisplayApp:
         self.worker_active = False
         self.result_queue: Queue[tuple[str, object]] = Queue()
         self.latest_frame: np.ndarray | None = None
+        self._frame_lock = threading.Lock()
+        self._preview_queue: Queue[Image.Image] = Queue(maxsize=1)
+        self._preview_size = (config.preview_width, config.preview_height)
+        # Voorkomt gelijktijdige capture_array-aanvragen van preview en classificatie
+        self._camera_lock = threading.Lock()
+        self._jobs: Queue[tuple[bool, bool] | None] = Queue(maxsize=2)
+        self._save_queue: Queue[tuple[Path, np.ndarray] | None] = Queue()
+        self._preview_photo: ImageTk.PhotoImage | None = None
         self.session: ort.InferenceSession | None = None
         self.input_name: str | None = None
+        self.io_binding: ort.IOBinding | None = None
+        self._output_buf: np.ndarray | None = None
+        self._pct_buf: np.ndarray | None = None
         self.camera: Picamera2 | None = None
+        self.use_lores = False
+        # Herbruikbare buffers voor preprocess_image (geen allocaties per classificatie)
+        self._prep_buf = np.empty((1, 3, *INPUT_SIZE), dtype=np.float32)
+        self._burst_buf = np.empty((config.burst_size, 3, *INPUT_SIZE), dtype=np.float32)
+        self.supports_burst = False
 
         self.setup_gui()
         self._set_buttons_enabled(False)
@@ -125,6 +287,16 @@ class SmartBinDisplayApp:
         init_thread.daemon = True
         init_thread.start()
 
+        # Eén vaste worker voor classificaties i.p.v. een nieuwe thread per klik
+        self._worker = threading.Thread(target=self._worker_loop)
+        self._worker.daemon = True
+        self._worker.start()
+
+        # JPEG-encoding en schijf-I/O los van het classificatiepad
+        self._save_thread = threading.Thread(target=self._save_loop)
+        self._save_thread.daemon = True
+        self._save_thread.start()
+
     def setup_gui(self) -> None:
         self.root = tk.Tk()
         self.root.title("Smart Bin Display")
@@ -166,6 +338,7 @@ class SmartBinDisplayApp:
             font=("Helvetica", 16),
         )
         self.preview_label.pack(fill=tk.BOTH, expand=True)
+        self.preview_label.bind("<Configure>", self._on_preview_resize)
 
         # Right Column (Sidebar)
         right_col = tk.Frame(main_container, bg=COLOR_SIDEBAR, width=320)
@@ -248,10 +421,31 @@ class SmartBinDisplayApp:
 
             self.progress_bars[class_name] = {"bar": progress, "label": percentage}
 
+        # Vaste volgorde van widgets (zelfde als self.classes) voor _update_results
+        self._bar_list = [self.progress_bars[name]["bar"] for name in self.classes]
+        self._pct_list = [self.progress_bars[name]["label"] for name in self.classes]
+
         # Buttons
         button_frame = tk.Frame(right_col, bg=COLOR_SIDEBAR)
         button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=20)
 
+        # Burst: meerdere frames in één batch classificeren (enkel bij dynamische batch-as)
+        self.burst_var = tk.BooleanVar(value=False)
+        self.burst_check = tk.Checkbutton(
+            button_frame,
+            text=f"Burst ({self.config.burst_size} frames)",
+            variable=self.burst_var,
+            font=("Helvetica", 10),
+            bg=COLOR_SIDEBAR,
+            fg=COLOR_TEXT,
+            selectcolor=COLOR_BG,
+            activebackground=COLOR_SIDEBAR,
+            activeforeground=COLOR_TEXT,
+            highlightthickness=0,
+            anchor="w",
+        )
+        self.burst_check.pack(fill=tk.X, pady=(0, 10))
+
         self.classify_btn = tk.Button(
             button_frame,
             text="ANALYSEER NU",
@@ -301,81 +495,194 @@ class SmartBinDisplayApp:
 
         self.root.after(50, self._process_worker_messages)
 
+    def _pin_thread(self, cores: set[int]) -> None:
+        if self.config.pin_cores:
+            pin_current_thread(cores)
+
     def _initialize_worker(self) -> None:
+        # De thread-pool van ONNX Runtime ontstaat hier en erft deze cores
+        self._pin_thread(CORES_INFERENCE)
+        intra_op_threads = len(CORES_INFERENCE) if self.config.pin_cores else None
         try:
             print("Initializing model...")
             resolved_model = resolve_model_path(self.config.model_path)
             print(f"Loading model: {resolved_model}")
-            session = ort.InferenceSession(resolved_model)
+            session = create_inference_session(resolved_model, intra_op_threads)
             input_name = session.get_inputs()[0].name
+            io_binding, output_buf = self._bind_io(session, input_name)
 
             print("Initializing camera...")
             camera = Picamera2()
-            camera_config = camera.create_preview_configuration(
-                main={"size": (640, 480), "format": "RGB888"}
-            )
-            camera.configure(camera_config)
+            try:
+                # Tweede stream die de ISP in hardware naar de modelgrootte schaalt
+                camera_config = camera.create_preview_configuration(
+                    main={"size": (640, 480), "format": "RGB888"},
+                    lores={"size": INPUT_SIZE, "format": "RGB888"},
+                    buffer_count=4,
+                )
+                camera.configure(camera_config)
+                use_lores = True
+            except Exception as exc:  # noqa: BLE001
+                # Oudere Pi's (VC4) ondersteunen enkel YUV420 voor lores
+                print(f"Lores stream niet beschikbaar ({exc}), schalen op CPU.")
+                camera_config = camera.create_preview_configuration(
+                    main={"size": (640, 480), "format": "RGB888"},
+                    buffer_count=4,
+                )
+                camera.configure(camera_config)
+                use_lores = False
             camera.start()
-            time.sleep(1)
+            # Wacht tot belichting (AE) vastligt i.p.v. een vaste pauze van 1 s,
+            # met een plafond zodat een camera zonder AeLocked niet blijft hangen
+            for _ in range(AE_SETTLE_MAX_FRAMES):
+                if camera.capture_metadata().get("AeLocked", False):
+                    break
+
+            # Opwarmen met een echt frame uit dezelfde stream als classify: Picamera2
+            # knipt de rij-padding weg, dus Numba moet de kernel voor die niet-
+            # aaneengesloten layout nu compileren, niet bij de eerste klik. Ook
+            # resize, geheugenarena en kernelselectie van ONNX Runtime gebeuren hier.
+            self.preprocess_image(camera.capture_array("lores" if use_lores else "main"))
+            session.run_with_iobinding(io_binding)
 
             if not self.running:
                 camera.stop()
                 return
 
-            self.result_queue.put(("init_ok", (session, input_name, camera, resolved_model)))
+            capture_thread = threading.Thread(target=self._capture_loop, args=(camera,))
+            capture_thread.daemon = True
+            capture_thread.start()
+
+            self.result_queue.put(("init_ok", (session, input_name, io_binding, output_buf, camera, use_lores, resolved_model)))
         except Exception as exc:  # noqa: BLE001
             self.result_queue.put(("init_error", str(exc)))
 
+    def _bind_io(
+        self, session: ort.InferenceSession, input_name: str
+    ) -> tuple[ort.IOBinding, np.ndarray]:
+        """Koppel de vaste in- en uitvoerbuffers eenmalig aan de sessie."""
+        if session.get_inputs()[0].type == "tensor(uint8)":
+            # Normalisatie zit in het model (embed_normalization.py): ruwe pixels volstaan
+            self._prep_buf = np.empty(self._prep_buf.shape, dtype=np.uint8)
+            self._burst_buf = np.empty(self._burst_buf.shape, dtype=np.uint8)
+
+        output_meta = session.get_outputs()[0]
+        num_classes = output_meta.shape[-1]
+        if not isinstance(num_classes, int) or num_classes <= 0:
+            num_classes = len(self.classes)
+        output_buf = np.empty((1, num_classes), dtype=np.float32)
+
+        # Op de CPU delen deze OrtValues hun geheugen met de NumPy-buffers,
+        # dus preprocess_image vult de modelinput rechtstreeks in.
+        io_binding = session.io_binding()
+        io_binding.bind_ortvalue_input(input_name, ort.OrtValue.ortvalue_from_numpy(self._prep_buf))
+        io_binding.bind_ortvalue_output(output_meta.name, ort.OrtValue.ortvalue_from_numpy(output_buf))
+        return io_binding, output_buf
+
+    def _on_preview_resize(self, event: tk.Event) -> None:
+        # De capture-thread mag geen Tk-calls doen, dus houd de doelgrootte hier bij
+        if event.width > 1 and event.height > 1:
+            self._preview_size = (event.width, event.height)
+
+    def _capture_loop(self, camera: Picamera2) -> None:
+        """Lees frames in de achtergrond en zet ze om tot preview-afbeelding.
+
+        De queue bewaart enkel de nieuwste preview; de Tk-thread hoeft die
+        alleen nog in de PhotoImage te plakken.
+        """
+        self._pin_thread(CORES_IO)
+        # De camera levert tot ~120 fps; Tk toont er maar één per update_ms
+        period = self.config.update_ms / 1000
+        while self.running:
+            started = time.perf_counter()
+            try:
+                with self._camera_lock:
+                    frame = camera.capture_array()
+            except Exception as exc:  # noqa: BLE001
+                if self.running:
+                    self.result_queue.put(("camera_error", str(exc)))
+                    time.sleep(period)
+                continue
+
+            # Geen kopie nodig: capture_array() levert per opname een nieuwe buffer.
+            # Het frame blijft BGR; preprocess_image houdt daar rekening mee.
+            with self._frame_lock:
+                self.latest_frame = frame
+
+            # Enkel renderen als Tk de vorige preview al heeft opgehaald; deze
+            # thread is de enige producent, dus put_nowait kan dan niet falen.
+            if not self._preview_queue.full():
+                self._preview_queue.put_nowait(self._render_preview(frame))
+
+            remaining = period - (time.perf_counter() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _render_preview(self, frame: np.ndarray) -> Image.Image:
+        # Picamera2 levert BGR, PIL verwacht RGB – laat de raw-decoder de kanalen omdraaien
+        frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+        img = Image.frombuffer("RGB", (width, height), frame, "raw", "BGR", 0, 1)
+
+        if self.config.rotate:
+            img = img.rotate(self.config.rotate, expand=True)
+
+        # Schalen naar de huidige grootte van het preview venster
+        target_size = self._preview_size
+        if img.size != target_size:
+            img = img.resize(target_size, Image.Resampling.BILINEAR)
+        return img
+
     def update_preview(self) -> None:
         if not self.running:
             return
 
-        if self.camera is None:
-            self.root.after(self.config.update_ms, self.update_preview)
-            return
-
+        # Enkel tekenen als de capture-thread een nieuwe preview heeft klaargezet
         try:
-            image = self.camera.capture_array()
-        except Exception as exc:  # noqa: BLE001
-            self._set_error(f"Camerafout: {exc}")
-            self._set_status("Camera kon niet lezen. Controleer camera-aansluiting.", "#B00020")
+            img = self._preview_queue.get_nowait()
+        except Empty:
             self.root.after(self.config.update_ms, self.update_preview)
             return
 
-        # Picamera2 levert BGR, PIL verwacht RGB – draai kanalen om
-        image = image[:, :, ::-1]
-        self.latest_frame = image.copy()
-        img = Image.fromarray(image)
-
-        if self.config.rotate:
-            img = img.rotate(self.config.rotate, expand=True)
-
-        # Slim schalen naar preview venster met behoud van aspect ratio of 'cover'
-        preview_w = self.preview_label.winfo_width()
-        preview_h = self.preview_label.winfo_height()
-
-        if preview_w > 1 and preview_h > 1:
-            img = img.resize((preview_w, preview_h), Image.Resampling.LANCZOS)
+        # Hergebruik dezelfde Tk-afbeelding; enkel bij een nieuwe grootte opnieuw aanmaken
+        photo = self._preview_photo
+        if photo is None or (photo.width(), photo.height()) != img.size:
+            self._preview_photo = ImageTk.PhotoImage(img)
+            self.preview_label.configure(image=self._preview_photo, text="")
         else:
-            img = img.resize((self.config.preview_width, self.config.preview_height), Image.Resampling.LANCZOS)
-
-        photo = ImageTk.PhotoImage(img)
-
-        self.preview_label.configure(image=photo, text="")
-        self.preview_label.image = photo
+            photo.paste(img)
         self.root.after(self.config.update_ms, self.update_preview)
 
-    def preprocess_image(self, image: np.ndarray) -> np.ndarray:
-        img = Image.fromarray(image).resize((224, 224))
-        img_array = np.array(img).astype(np.float32) / 255.0
-
-        mean = np.array([0.485, 0.456, 0.406], dtype=np.float32)
-        std = np.array([0.229, 0.224, 0.225], dtype=np.float32)
-        img_array = (img_array - mean) / std
+    def preprocess_image(self, image: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Schrijf het genormaliseerde frame in ``out`` (standaard de gebonden invoerbuffer)."""
+        if out is None:
+            out = self._prep_buf
 
-        img_array = img_array.transpose(2, 0, 1)
-        img_array = np.expand_dims(img_array, axis=0).astype(np.float32)
-        return img_array
+        if image.shape[:2] == INPUT_SIZE:
+            # Frame van de lores-stream: al geschaald door de ISP
+            img_array = image
+        elif cv2 is not None:
+            img_array = cv2.resize(image, INPUT_SIZE, interpolation=cv2.INTER_AREA)
+        else:
+            img = Image.fromarray(image).resize(INPUT_SIZE, Image.Resampling.BILINEAR)
+            img_array = np.asarray(img, dtype=np.uint8)
+
+        if out.dtype == np.uint8:
+            # Model normaliseert zelf: enkel BGR -> RGB en HWC -> CHW
+            np.copyto(out[0], img_array.transpose(2, 0, 1)[::-1])
+            return out
+
+        if _normalize_bgr_to_nchw is not None:
+            _normalize_bgr_to_nchw(img_array, NORM_SCALE, NORM_BIAS, out)
+            return out
+
+        # Per kanaal rechtstreeks in de NCHW-buffer schrijven: geen transpose-kopie.
+        # Frames zijn BGR (Picamera2), dus RGB-kanaal c komt uit framekanaal 2 - c.
+        for channel in range(3):
+            plane = out[0, channel]
+            np.multiply(img_array[:, :, 2 - channel], NORM_SCALE[channel], out=plane, dtype=np.float32)
+            plane += NORM_BIAS[channel]
+        return out
 
     def classify_threaded(self, save: bool = False) -> None:
         if not self.running or self.worker_active:
@@ -384,50 +691,138 @@ class SmartBinDisplayApp:
             self._set_error("Nog niet klaar: model/camera initialiseren.")
             return
 
+        burst = self.supports_burst and self.burst_var.get()
+        try:
+            self._jobs.put_nowait((save, burst))
+        except Full:
+            return  # Dubbele klik: er staat al een opdracht klaar
         self.worker_active = True
         self._set_buttons_enabled(False)
-        thread = threading.Thread(target=self._classify_worker, args=(save,))
-        thread.daemon = True
-        thread.start()
 
-    def _classify_worker(self, save: bool) -> None:
+    def _worker_loop(self) -> None:
+        # ONNX Runtime rekent ook op de aanroepende thread: zelfde cores als de pool
+        self._pin_thread(CORES_INFERENCE)
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            save, burst = job
+            self._classify_worker(save, burst)
+
+    def _classify_worker(self, save: bool, burst: bool = False) -> None:
         try:
-            self.classify(save_photo=save)
+            if burst:
+                self.classify_burst(save_photo=save)
+            else:
+                self.classify(save_photo=save)
         except Exception as exc:  # noqa: BLE001
             self.result_queue.put(("error", str(exc)))
         finally:
             self.result_queue.put(("done", None))
 
     def classify(self, save_photo: bool = False) -> None:
-        if self.session is None or self.input_name is None:
+        if self.session is None or self.io_binding is None:
             raise RuntimeError("Model is nog niet geladen.")
 
-        if self.latest_frame is not None:
-            image = self.latest_frame.copy()
-        else:
+        with self._frame_lock:
+            image = self.latest_frame
+        if image is None:
             if self.camera is None:
                 raise RuntimeError("Camera is nog niet klaar.")
-            image = self.camera.capture_array()
+            with self._camera_lock:
+                image = self.camera.capture_array()
 
         if save_photo:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             output_path = Path(__file__).resolve().parent / f"capture_{timestamp}.jpg"
-            Image.fromarray(image).save(output_path)
-            print(f"Saved: {output_path}")
+            self._save_queue.put_nowait((output_path, image))
 
-        img_array = self.preprocess_image(image)
-        start = time.time()
-        outputs = self.session.run(None, {self.input_name: img_array})
-        inference_time = (time.time() - start) * 1000
+        if self.use_lores:
+            with self._camera_lock:
+                lores_frame = self.camera.capture_array("lores")
+            self.preprocess_image(lores_frame)
+        else:
+            self.preprocess_image(image)
+        start = time.perf_counter_ns()
+        self.session.run_with_iobinding(self.io_binding)
+        inference_time = (time.perf_counter_ns() - start) / 1e6
 
-        raw_output = np.asarray(outputs[0][0], dtype=np.float32)
+        raw_output = self._output_buf[0]
         # Apply softmax explicitly to ensure we have probabilities (0-1)
         # This fixes issues where the model outputs logits (unbounded numbers)
-        exp_x = np.exp(raw_output - np.max(raw_output))
-        probabilities = exp_x / exp_x.sum()
+        # Rechtstreeks als percentages in een vaste buffer, zonder tussenarrays
+        percentages = self._pct_buf
+        np.subtract(raw_output, raw_output.max(), out=percentages)
+        np.exp(percentages, out=percentages)
+        np.multiply(percentages, 100.0 / percentages.sum(), out=percentages)
+
+        # Kleine Python-lijst naar de Tk-thread, zodat die geen gedeelde NumPy-buffer leest.
+        # Bij een handvol klassen is max() op de lijst goedkoper dan np.argmax.
+        percentages_list = percentages.tolist()
+        predicted_idx = max(range(len(percentages_list)), key=percentages_list.__getitem__)
+        self.result_queue.put(("result", (percentages_list, predicted_idx, inference_time)))
+
+    def classify_burst(self, save_photo: bool = False) -> None:
+        """Classificeer een reeks opeenvolgende frames in één batch en middel de kansen."""
+        if self.session is None or self.input_name is None:
+            raise RuntimeError("Model is nog niet geladen.")
+        if self.camera is None:
+            raise RuntimeError("Camera is nog niet klaar.")
+
+        # Frames op update_ms van elkaar, zodat ruis en kleine bewegingen verschillen;
+        # kort na elkaar gegrepen frames zijn quasi identiek en middelen niets uit
+        stream = "lores" if self.use_lores else "main"
+        period = self.config.update_ms / 1000.0
+        last_index = len(self._burst_buf) - 1
+        for index in range(len(self._burst_buf)):
+            started = time.perf_counter()
+            with self._camera_lock:
+                frame = self.camera.capture_array(stream)
+            self.preprocess_image(frame, out=self._burst_buf[index:index + 1])
+            if index < last_index:
+                remaining = period - (time.perf_counter() - started)
+                if remaining > 0:
+                    time.sleep(remaining)
 
-        predicted_idx = int(np.argmax(probabilities))
-        self.result_queue.put(("result", (probabilities, predicted_idx, inference_time)))
+        if save_photo:
+            with self._frame_lock:
+                image = self.latest_frame
+            if image is not None:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                output_path = Path(__file__).resolve().parent / f"capture_{timestamp}.jpg"
+                self._save_queue.put_nowait((output_path, image))
+
+        # De vaste IoBinding hoort bij batch 1; de burst gebruikt een gewone run
+        start = time.perf_counter_ns()
+        outputs = self.session.run(None, {self.input_name: self._burst_buf})
+        inference_time = (time.perf_counter_ns() - start) / 1e6
+
+        raw_output = np.asarray(outputs[0], dtype=np.float32)
+        exp_x = np.exp(raw_output - raw_output.max(axis=1, keepdims=True))
+        probabilities = (exp_x / exp_x.sum(axis=1, keepdims=True)).mean(axis=0)
+
+        percentages_list = (probabilities * 100.0).tolist()
+        predicted_idx = max(range(len(percentages_list)), key=percentages_list.__getitem__)
+        self.result_queue.put(("result", (percentages_list, predicted_idx, inference_time)))
+
+    def _save_loop(self) -> None:
+        self._pin_thread(CORES_IO)
+        while True:
+            job = self._save_queue.get()
+            if job is None:
+                return
+            output_path, image = job
+            try:
+                if cv2 is not None:
+                    # Frames zijn al BGR, precies wat OpenCV verwacht; imwrite geeft
+                    # False terug in plaats van een exceptie te gooien
+                    if not cv2.imwrite(str(output_path), image, [cv2.IMWRITE_JPEG_QUALITY, 85]):
+                        raise OSError(f"cv2.imwrite kon {output_path} niet schrijven")
+                else:
+                    Image.fromarray(image[:, :, ::-1]).save(output_path)
+                print(f"Saved: {output_path}")
+            except Exception as exc:  # noqa: BLE001
+                self.result_queue.put(("error", f"Opslaan mislukt: {exc}"))
 
     def _process_worker_messages(self) -> None:
         if not self.running:
@@ -440,15 +835,24 @@ class SmartBinDisplayApp:
                 break
 
             if message_type == "result":
-                probabilities, predicted_idx, inference_time = payload
-                self._update_results(probabilities, predicted_idx, inference_time)
+                percentages, predicted_idx, inference_time = payload
+                self._update_results(percentages, predicted_idx, inference_time)
             elif message_type == "error":
                 self._set_error(str(payload))
+            elif message_type == "camera_error":
+                self._set_error(f"Camerafout: {payload}")
+                self._set_status("Camera kon niet lezen. Controleer camera-aansluiting.", "#B00020")
             elif message_type == "init_ok":
-                session, input_name, camera, resolved_model = payload
+                session, input_name, io_binding, output_buf, camera, use_lores, resolved_model = payload
                 self.session = session
                 self.input_name = input_name
+                self.io_binding = io_binding
+                self._output_buf = output_buf
+                self._pct_buf = np.empty(output_buf.shape[1], dtype=np.float32)
                 self.camera = camera
+                self.use_lores = use_lores
+                # Burst kan enkel als het model een dynamische batch-as heeft
+                self.supports_burst = not isinstance(session.get_inputs()[0].shape[0], int)
                 self.initialized = True
                 self.prediction_label.config(text="Klaar voor classificatie", fg="#333333")
                 self._set_status(f"Gereed. Model: {Path(resolved_model).name}")
@@ -469,6 +873,7 @@ class SmartBinDisplayApp:
         bg_color = COLOR_ACCENT if enabled else "#555555"
         self.classify_btn.config(state=state, bg=bg_color)
         self.save_btn.config(state=state)
+        self.burst_check.config(state=state if self.supports_burst else "disabled")
 
     def _set_error(self, message: str) -> None:
         self.prediction_label.config(text="Fout", fg=COLOR_ERROR)
@@ -479,7 +884,7 @@ class SmartBinDisplayApp:
 
     def _update_results(
         self,
-        probabilities: np.ndarray,
+        percentages: list[float],
         predicted_idx: int,
         inference_time: float,
     ) -> None:
@@ -494,23 +899,23 @@ class SmartBinDisplayApp:
             text=f"{predicted_name}",
             fg=predicted_color,
         )
-        self.time_label.config(text=f"Inferentie: {inference_time:.1f} ms")
+        self.time_label.config(text="Inferentie: %.1f ms" % inference_time)
+
+        # Update Progress Bars (ontbrekende klassen tonen 0%)
+        padded = percentages + [0.0] * (len(self._bar_list) - len(percentages))
+        for bar, label, percentage in zip(self._bar_list, self._pct_list, padded):
+            bar["value"] = percentage
+            label.config(text="%.1f%%" % percentage)
 
-        # Update Progress Bars
-        for index, class_name in enumerate(self.classes):
-            probability = float(probabilities[index]) * 100.0 if index < len(probabilities) else 0.0
-            bar = self.progress_bars[class_name]["bar"]
-            label = self.progress_bars[class_name]["label"]
-            
-            bar["value"] = probability
-            label.config(text=f"{probability:.1f}%")
-            
             # Dynamic color for bar? (Not easy with standard ttk theme on linux without heavy styling)
             # We keep standard accent color.
 
+        # Alle widgetwijzigingen in één keer laten hertekenen
+        self.root.update_idletasks()
+
         predicted_prob = (
-            float(probabilities[predicted_idx]) * 100.0
-            if predicted_idx < len(probabilities)
+            percentages[predicted_idx]
+            if predicted_idx < len(percentages)
             else 0.0
         )
         # Also print to terminal
@@ -521,6 +926,13 @@ class SmartBinDisplayApp:
 
     def on_closing(self) -> None:
         self.running = False
+        try:
+            self._jobs.put_nowait(None)
+        except Full:
+            pass  # Worker is een daemon-thread en stopt met het proces
+        # Foto's die nog in de wachtrij staan eerst wegschrijven
+        self._save_queue.put(None)
+        self._save_thread.join(timeout=SAVE_FLUSH_TIMEOUT_S)
         try:
             if self.camera is not None:
                 self.camera.stop()
@@ -572,6 +984,12 @@ def parse_args() -> argparse.Namespace:
         action="store_false",
         help="Schakel fullscreen uit (bijv. voor desktop gebruik)",
     )
+    parser.add_argument(
+        "--affinity",
+        action="store_true",
+        default=False,
+        help="Pin Tk, camera en inferentie op aparte CPU-cores (Pi met 4 cores)",
+    )
     return parser.parse_args()
 
 
@@ -586,6 +1004,7 @@ def main() -> None:
         preview_height=max(args.preview_height, 90),
         rotate=args.rotate,
         fullscreen=args.fullscreen,
+        pin_cores=args.affinity,
     )
 
     try: